@@ -65,7 +65,8 @@ def inspect_geojson():
         geometry_types = {}
         coord_depths = {}
         
-        for idx, feature in enumerate(data['features'][:5]):  # Sample 5 pertama
+        # Sample 5 pertama; validasi semua feature: python validate_geojson.py
+        for idx, feature in enumerate(data['features'][:5]):
             geom = feature.get('geometry', {})
             geom_type = geom.get('type')
             coords = geom.get('coordinates', [])
@@ -91,7 +92,7 @@ def inspect_geojson():
                         print(f"  First coordinate: [{lon:.4f}, {lat:.4f}, {z:.1f}]")
                         print(f"  ⚠ PERINGATAN: Koordinat 3D terdeteksi!")
                         print(f"    GEE hanya terima 2D (lon, lat)")
-                        print(f"    → Kode sudah menangani ini otomatis (hapus Z)")
+                        print(f"    → Jalankan validate_geojson.py untuk menghapus Z")
                     elif len(sample_coord) == 2:
                         lon, lat = sample_coord
                         print(f"  First coordinate: [{lon:.4f}, {lat:.4f}]")
@@ -0,0 +1,424 @@
+"""
+Script untuk validasi dan perbaikan file GeoJSON batas wilayah
+Jalankan: python validate_geojson.py [input.geojson] [output.geojson]
+
+Semua feature diperiksa sekaligus: koordinat seluruh ring diratakan menjadi
+satu array NumPy, lalu setiap pemeriksaan dihitung secara vektor di atas array
+tersebut (bukan sampel beberapa feature pertama seperti debug_geojson.py).
+"""
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+GEOJSON_PATH = '2d.geojson'
+OUTPUT_PATH = '2d_clean.geojson'
+KOLOM_KECAMATAN = 'WADMKC'
+
+# Batas wajar koordinat Depok (lon_min, lat_min, lon_max, lat_max)
+EXTENT_DEPOK = (106.0, -7.0, 107.0, -6.0)
+MIN_RING_VERTICES = 4  # Ring tertutup minimal: 3 titik unik + titik penutup
+MAX_DROPPED_FRACTION = 0.1  # Peringatan bila > 10% feature dibuang saat perbaikan
+
+
+def flatten_geojson(data):
+    """
+    Ratakan semua ring dari semua feature menjadi array koordinat datar.
+
+    Mengembalikan dict berisi:
+      xy            (N, 2) float  - lon/lat semua vertex
+      has_z         (N,)   bool   - vertex memiliki dimensi ketiga (Z)
+      ring_offsets  (R+1,) int    - awal/akhir setiap ring di dalam xy
+      ring_polygon  (R,)   int    - indeks polygon pemilik ring
+      ring_exterior (R,)   bool   - True untuk ring luar (indeks 0 di polygon)
+      ring_malformed (R,)  bool   - ring bukan list koordinat [lon, lat(, z)]
+      polygon_feature (P,) int    - indeks feature pemilik polygon
+      polygon_malformed (P,) bool - kedalaman nested list polygon salah
+      feature_type  list          - tipe geometry asli per feature
+      feature_malformed (F,) bool - entry feature/geometry bukan object JSON
+
+    Ring/polygon dengan struktur salah tidak menyumbang vertex (panjang 0),
+    sehingga otomatis terhitung invalid dan dibuang saat perbaikan.
+    """
+    xy_parts, z_parts, ring_lengths = [], [], []
+    ring_polygon, ring_exterior, ring_malformed = [], [], []
+    polygon_feature, polygon_malformed = [], []
+    feature_type, feature_malformed = [], []
+
+    for f_idx, feature in enumerate(data['features']):
+        geom = feature.get('geometry') if isinstance(feature, dict) else None
+        feature_malformed.append(not isinstance(feature, dict)
+                                 or not isinstance(geom, (dict, type(None))))
+        if not isinstance(geom, dict):
+            geom = {}
+        geom_type = geom.get('type')
+        coords = geom.get('coordinates') or []
+        feature_type.append(geom_type)
+
+        if geom_type == 'Polygon':
+            polygons = [coords]
+        elif geom_type == 'MultiPolygon':
+            polygons = coords if isinstance(coords, list) else [coords]
+        else:
+            polygons = []
+
+        for polygon in polygons:
+            p_idx = len(polygon_feature)
+            polygon_feature.append(f_idx)
+            # Polygon yang benar: [[[lon, lat], ...], ...] -> kedalaman 2
+            if get_coords_depth(polygon) != 2:
+                polygon_malformed.append(True)
+                continue
+            polygon_malformed.append(False)
+            for r_idx, ring in enumerate(polygon):
+                arr = _ring_to_array(ring)
+                ring_malformed.append(arr is None)
+                if arr is None:
+                    arr = np.empty((0, 2))
+                xy_parts.append(arr[:, :2])
+                z_parts.append(~np.isnan(arr[:, 2]) if arr.shape[1] > 2 else np.zeros(len(arr), dtype=bool))
+                ring_lengths.append(len(arr))
+                ring_polygon.append(p_idx)
+                ring_exterior.append(r_idx == 0)
+
+    ring_offsets = np.zeros(len(ring_lengths) + 1, dtype=np.int64)
+    np.cumsum(ring_lengths, out=ring_offsets[1:])
+
+    return {
+        'xy': np.concatenate(xy_parts) if xy_parts else np.empty((0, 2)),
+        'has_z': np.concatenate(z_parts) if z_parts else np.empty(0, dtype=bool),
+        'ring_offsets': ring_offsets,
+        'ring_polygon': np.asarray(ring_polygon, dtype=np.int64),
+        'ring_exterior': np.asarray(ring_exterior, dtype=bool),
+        'ring_malformed': np.asarray(ring_malformed, dtype=bool),
+        'polygon_feature': np.asarray(polygon_feature, dtype=np.int64),
+        'polygon_malformed': np.asarray(polygon_malformed, dtype=bool),
+        'feature_type': feature_type,
+        'feature_malformed': np.asarray(feature_malformed, dtype=bool),
+    }
+
+
+def nama_wilayah(feature, kolom=KOLOM_KECAMATAN):
+    """Nama wilayah sebagai string; 'Unknown' bila kolom kosong (null/tidak ada)."""
+    props = feature.get('properties') if isinstance(feature, dict) else None
+    value = props.get(kolom) if isinstance(props, dict) else None
+    return str(value) if value is not None else 'Unknown'
+
+
+def get_coords_depth(coords, depth=0):
+    """Helper function untuk cek kedalaman nested list koordinat."""
+    if not isinstance(coords, list) or len(coords) == 0:
+        return depth
+    if isinstance(coords[0], (int, float)):
+        return depth
+    return get_coords_depth(coords[0], depth + 1)
+
+
+def _ring_to_array(ring):
+    """
+    Konversi satu ring ke array (n, 2|3); koordinat campuran 2D/3D dipadatkan.
+    Mengembalikan None bila struktur ring bukan list koordinat [lon, lat(, z)].
+    """
+    if get_coords_depth(ring) != 1:
+        return None
+    try:
+        arr = np.asarray(ring, dtype=float)
+        if arr.ndim == 2 and arr.shape[1] >= 2:
+            return arr[:, :3]
+    except (ValueError, TypeError):
+        pass
+    # Ring tidak seragam (campuran 2D/3D): isi kolom Z yang hilang dengan NaN
+    arr = np.full((len(ring), 3), np.nan)
+    try:
+        for i, coord in enumerate(ring):
+            if not isinstance(coord, list) or len(coord) < 2:
+                return None
+            arr[i, :min(len(coord), 3)] = coord[:3]
+    except (ValueError, TypeError):
+        return None
+    return arr
+
+
+def analyze_geometry(flat, extent=EXTENT_DEPOK):
+    """Hitung semua masalah geometry secara vektor di atas array datar."""
+    xy = flat['xy']
+    offsets = flat['ring_offsets']
+    starts, ends = offsets[:-1], offsets[1:]
+    lengths = ends - starts
+    n_rings = len(lengths)
+    nonempty = lengths > 0
+
+    ring_id = np.repeat(np.arange(n_rings), lengths)
+    finite = np.isfinite(xy).all(axis=1)
+
+    # Ring tidak tertutup: vertex pertama != vertex terakhir
+    unclosed = np.zeros(n_rings, dtype=bool)
+    unclosed[nonempty] = np.any(
+        xy[starts[nonempty]] != xy[ends[nonempty] - 1], axis=1
+    )
+
+    # Duplikat berurutan: vertex sama dengan vertex sebelumnya di ring yang sama
+    duplicate = np.zeros(len(xy), dtype=bool)
+    if len(xy) > 1:
+        duplicate[1:] = np.all(xy[1:] == xy[:-1], axis=1) & (ring_id[1:] == ring_id[:-1])
+
+    # Di luar extent
+    lon_min, lat_min, lon_max, lat_max = extent
+    out_of_extent = finite & ~(
+        (xy[:, 0] >= lon_min) & (xy[:, 0] <= lon_max)
+        & (xy[:, 1] >= lat_min) & (xy[:, 1] <= lat_max)
+    )
+
+    # Luas ring (shoelace) dihitung per ring dengan reduceat
+    area = np.zeros(n_rings)
+    if len(xy):
+        nxt = np.arange(1, len(xy) + 1)
+        nxt[ends[nonempty] - 1] = starts[nonempty]
+        cross = xy[:, 0] * xy[nxt, 1] - xy[nxt, 0] * xy[:, 1]
+        area[nonempty] = 0.5 * np.add.reduceat(cross, starts[nonempty])
+
+    # Jumlah vertex unik efektif (tanpa duplikat berurutan & titik penutup)
+    unique_count = lengths - np.bincount(ring_id[duplicate], minlength=n_rings)
+    unique_count -= (~unclosed & nonempty).astype(np.int64)
+
+    ring_nonfinite = np.bincount(ring_id[~finite], minlength=n_rings) > 0
+    ring_invalid = (
+        (unique_count < MIN_RING_VERTICES - 1)
+        | ring_nonfinite
+        | ~(np.abs(area) > 0)
+    )
+
+    return {
+        'ring_id': ring_id,
+        'finite': finite,
+        'duplicate': duplicate,
+        'out_of_extent': out_of_extent,
+        'unclosed': unclosed,
+        'area': area,
+        'ring_invalid': ring_invalid,
+    }
+
+
+def summarize_regions(data, flat, checks, kolom=KOLOM_KECAMATAN):
+    """Ringkasan per wilayah: bounding box, jumlah vertex, dan jumlah masalah."""
+    nama = np.array([nama_wilayah(f, kolom) for f in data['features']], dtype=object)
+    feature_of_ring = flat['polygon_feature'][flat['ring_polygon']]
+    feature_of_vertex = feature_of_ring[checks['ring_id']]
+
+    vertices = pd.DataFrame({
+        'wilayah': nama[feature_of_vertex] if len(nama) else [],
+        # Vertex non-finite tidak ikut bounding box (min/max melewati NaN)
+        'lon': np.where(checks['finite'], flat['xy'][:, 0], np.nan),
+        'lat': np.where(checks['finite'], flat['xy'][:, 1], np.nan),
+        'vertex_3d': flat['has_z'],
+        'duplikat': checks['duplicate'],
+        'luar_extent': checks['out_of_extent'],
+    })
+    summary = vertices.groupby('wilayah').agg(
+        lon_min=('lon', 'min'),
+        lat_min=('lat', 'min'),
+        lon_max=('lon', 'max'),
+        lat_max=('lat', 'max'),
+        vertex=('lon', 'size'),
+        vertex_3d=('vertex_3d', 'sum'),
+        duplikat=('duplikat', 'sum'),
+        luar_extent=('luar_extent', 'sum'),
+    )
+
+    rings = pd.DataFrame({
+        'wilayah': nama[feature_of_ring] if len(nama) else [],
+        'ring_terbuka': checks['unclosed'],
+        'ring_invalid': checks['ring_invalid'] & ~flat['ring_malformed'],
+        'ring_struktur_salah': flat['ring_malformed'],
+    })
+    ring_summary = rings.groupby('wilayah').sum()
+    features_per_region = pd.Series(nama, dtype=object).value_counts().rename('feature')
+
+    summary = summary.join(ring_summary, how='outer').join(features_per_region, how='outer')
+    counts = [c for c in summary.columns if not c.endswith(('_min', '_max'))]
+    summary[counts] = summary[counts].fillna(0).astype(int)
+    return summary.sort_index()
+
+
+def repair_geojson(data, flat, checks):
+    """
+    Bangun GeoJSON bersih dari array datar:
+      - hapus koordinat Z
+      - hapus vertex duplikat berurutan
+      - tutup ring yang terbuka
+      - buang ring invalid (termasuk ring yang memiliki vertex non-finite atau
+        struktur salah); polygon yang ring luarnya invalid ikut dibuang
+    Koordinat di luar extent hanya dilaporkan (kemungkinan masalah CRS).
+    """
+    xy = flat['xy']
+    offsets = flat['ring_offsets']
+    keep = ~checks['duplicate']
+
+    # Posisi ring setelah vertex dibuang, dihitung sekaligus dengan cumsum
+    kept_before = np.concatenate([[0], np.cumsum(keep)])
+    new_offsets = kept_before[offsets]
+    xy_keep = xy[keep]
+    clean_rings = [xy_keep[a:b] for a, b in zip(new_offsets[:-1], new_offsets[1:])]
+
+    ring_ok = ~checks['ring_invalid']
+    polygon_ok = ~flat['polygon_malformed']
+    polygon_ok[flat['ring_polygon'][flat['ring_exterior'] & ~ring_ok]] = False
+
+    polygons = [[] for _ in range(len(flat['polygon_feature']))]
+    for r_idx, ring in enumerate(clean_rings):
+        p_idx = flat['ring_polygon'][r_idx]
+        if not (ring_ok[r_idx] and polygon_ok[p_idx]):
+            continue
+        if np.any(ring[0] != ring[-1]):
+            ring = np.vstack([ring, ring[:1]])
+        polygons[p_idx].append(ring.tolist())
+
+    per_feature = [[] for _ in range(len(flat['feature_type']))]
+    for p_idx, rings in enumerate(polygons):
+        if rings:
+            per_feature[flat['polygon_feature'][p_idx]].append(rings)
+
+    cleaned = {k: v for k, v in data.items() if k != 'features'}
+    cleaned['features'] = []
+    dropped = []
+    for feature, geom_type, parts in zip(data['features'], flat['feature_type'], per_feature):
+        if not parts:
+            dropped.append(feature)
+            continue
+        if geom_type == 'Polygon':
+            geometry = {'type': 'Polygon', 'coordinates': parts[0]}
+        else:
+            geometry = {'type': 'MultiPolygon', 'coordinates': parts}
+        cleaned['features'].append({**feature, 'geometry': geometry})
+
+    return cleaned, dropped
+
+
+def validate_geojson(input_path=GEOJSON_PATH, output_path=OUTPUT_PATH):
+    """Validasi seluruh feature, tampilkan laporan, lalu tulis file bersih."""
+
+    print("=" * 70)
+    print("🔍 VALIDASI GEOJSON (SEMUA FEATURE)")
+    print("=" * 70)
+
+    try:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"\n✗ File tidak ditemukan: {input_path}")
+        return False
+    except json.JSONDecodeError as e:
+        print(f"\n✗ File GeoJSON tidak valid: {e}")
+        return False
+
+    if not isinstance(data, dict) or not isinstance(data.get('features'), list):
+        print(f"\n✗ File GeoJSON tidak valid: {input_path}")
+        print("  Harus berupa FeatureCollection dengan 'features' berupa list.")
+        return False
+
+    try:
+        return _validate_and_repair(data, input_path, output_path)
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def _validate_and_repair(data, input_path, output_path):
+    """Isi validate_geojson setelah file berhasil dimuat sebagai FeatureCollection."""
+    features = data['features']
+    print(f"\n✓ File berhasil dimuat: {input_path}")
+    print(f"  Total features: {len(features)}")
+
+    flat = flatten_geojson(data)
+    checks = analyze_geometry(flat)
+
+    unsupported = [
+        t for t, bad in zip(flat['feature_type'], flat['feature_malformed'])
+        if not bad and t not in ('Polygon', 'MultiPolygon')
+    ]
+    malformed = int(flat['feature_malformed'].sum() + flat['polygon_malformed'].sum()
+                    + flat['ring_malformed'].sum())
+    # Ring berstruktur salah sudah dihitung di 'malformed', jangan dihitung dua kali
+    ring_invalid = checks['ring_invalid'] & ~flat['ring_malformed']
+    n_rings = len(flat['ring_offsets']) - 1
+
+    print(f"  Total polygon: {len(flat['polygon_feature'])}")
+    print(f"  Total ring: {n_rings}")
+    print(f"  Total vertex: {len(flat['xy'])}")
+
+    print("\n" + "=" * 70)
+    print("📍 RINGKASAN PER WILAYAH")
+    print("=" * 70)
+    summary = summarize_regions(data, flat, checks)
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None,
+                           'display.width', 200,
+                           'display.float_format', '{:.5f}'.format):
+        print(summary)
+
+    print("\n" + "=" * 70)
+    print("🗺️  MASALAH GEOMETRY")
+    print("=" * 70)
+    issues = {
+        'Vertex 3D (Z akan dihapus)': int(flat['has_z'].sum()),
+        'Vertex non-finite (seluruh ring dibuang)': int((~checks['finite']).sum()),
+        'Vertex duplikat berurutan': int(checks['duplicate'].sum()),
+        'Vertex di luar extent Depok': int(checks['out_of_extent'].sum()),
+        'Ring tidak tertutup': int(checks['unclosed'].sum()),
+        'Ring invalid (< 3 titik / luas nol / NaN)': int(ring_invalid.sum()),
+        'Feature/polygon/ring struktur salah': malformed,
+        'Geometry type tidak didukung': len(unsupported),
+    }
+    for label, count in issues.items():
+        status = "✓" if count == 0 else "⚠"
+        print(f"  {status} {label:42s}: {count}")
+
+    if issues['Vertex di luar extent Depok']:
+        print("\n  ⚠ PERINGATAN: Ada koordinat di luar Depok!")
+        print(f"    Expected: lon {EXTENT_DEPOK[0]}..{EXTENT_DEPOK[2]}, "
+              f"lat {EXTENT_DEPOK[1]}..{EXTENT_DEPOK[3]}")
+        print("    Kemungkinan CRS bukan EPSG:4326 (tidak diperbaiki otomatis)")
+
+    if n_rings == 0:
+        print("\n✗ Tidak ada ring/polygon yang bisa divalidasi")
+        print("  Pastikan file berisi feature dengan geometry Polygon/MultiPolygon.")
+        print("  File bersih tidak ditulis.")
+        return False
+
+    print("\n" + "=" * 70)
+    print("🛠️  PERBAIKAN")
+    print("=" * 70)
+    cleaned, dropped = repair_geojson(data, flat, checks)
+    for feature in dropped:
+        print(f"  ⚠ Feature dibuang (tidak ada polygon valid): {nama_wilayah(feature)}")
+
+    if not cleaned['features']:
+        print("\n✗ Semua feature dibuang, tidak ada geometry yang bisa dipakai")
+        print("  File bersih tidak ditulis.")
+        return False
+
+    if len(dropped) > MAX_DROPPED_FRACTION * len(features):
+        print(f"\n  ⚠ PERINGATAN: {len(dropped)} dari {len(features)} feature "
+              f"({len(dropped) / len(features):.0%}) dibuang!")
+        print("    Periksa file sumber sebelum dipakai main.py")
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(cleaned, f, ensure_ascii=False)
+    print(f"  ✓ File bersih ditulis: {output_path} ({len(cleaned['features'])} features)")
+
+    print("\n" + "=" * 70)
+    print("✅ VALIDASI SELESAI")
+    print("=" * 70)
+
+    return True
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    input_path = args[0] if len(args) > 0 else GEOJSON_PATH
+    output_path = args[1] if len(args) > 1 else OUTPUT_PATH
+    success = validate_geojson(input_path, output_path)
+    sys.exit(0 if success else 1)